@@ -1,6 +1,10 @@
 """Available Players tool implementation."""
 
+import heapq
 import logging
+import re
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any, Dict
 
 from src.models.draft_state_simple import DraftState
@@ -9,20 +13,31 @@ from src.tools.player_rankings import get_player_rankings
 
 logger = logging.getLogger(__name__)
 
+# Positions that have rankings available, in display order
+_POSITION_ORDER = ("QB", "RB", "WR", "TE", "K", "DST")
+_VALID_POSITIONS = frozenset(_POSITION_ORDER)
 
+# Punctuation stripped from player names before comparison
+_PUNCTUATION_TABLE = str.maketrans("", "", ".'-")
+
+# Generational suffixes, matched as whole words after whitespace is collapsed
+_SUFFIX_PATTERN = re.compile(r" (?:jr|sr|iii|ii|iv)\b")
+
+# Sort key for ranking dicts (higher projected points is better)
+_PROJECTED_POINTS_KEY = itemgetter("projected_points")
+
+
+@lru_cache(maxsize=4096)
 def _normalize_player_name(name: str) -> str:
-    """Normalize player name for comparison."""
-    normalized = name.lower()
-    # Remove common punctuation and suffixes
-    normalized = normalized.replace(".", "").replace("'", "").replace("-", "")
-    normalized = (
-        normalized.replace(" jr", "")
-        .replace(" sr", "")
-        .replace(" iii", "")
-        .replace(" ii", "")
-        .replace(" iv", "")
-    )
-    return " ".join(normalized.split()).strip()
+    """Normalize player name for comparison.
+
+    Results are memoized per process; the bounded cache comfortably holds every
+    rostered NFL player, so repeat lookups during a draft are dict hits.
+    """
+    # Lowercase, remove common punctuation and collapse whitespace
+    normalized = " ".join(name.lower().translate(_PUNCTUATION_TABLE).split())
+    # Remove suffixes
+    return _SUFFIX_PATTERN.sub("", normalized)
 
 
 async def get_available_players(position: str, limit: int) -> Dict[str, Any]:
@@ -43,11 +58,11 @@ async def get_available_players(position: str, limit: int) -> Dict[str, Any]:
 
     try:
         # Validate inputs
-        valid_positions = ["QB", "RB", "WR", "TE", "K", "DST"]
-        if position.upper() not in valid_positions:
+        normalized_position = position.upper()
+        if normalized_position not in _VALID_POSITIONS:
             return {
                 "success": False,
-                "error": f"Invalid position: {position}. Valid positions: {valid_positions}",
+                "error": f"Invalid position: {position}. Valid positions: {list(_POSITION_ORDER)}",
                 "error_type": "invalid_position",
             }
 
@@ -83,7 +98,7 @@ async def get_available_players(position: str, limit: int) -> Dict[str, Any]:
             }
 
         # Get player rankings for the specified position
-        rankings_result = await get_player_rankings(position=position.upper())
+        rankings_result = await get_player_rankings(position=normalized_position)
 
         if not rankings_result.get("success"):
             return {
@@ -95,33 +110,30 @@ async def get_available_players(position: str, limit: int) -> Dict[str, Any]:
         all_position_players = rankings_result["players"]
 
         # Create set of drafted player names for fast lookup
-        drafted_players = set()
-        for pick in draft_state.picks:
-            normalized_name = _normalize_player_name(pick.player.name)
-            drafted_players.add(normalized_name)
+        drafted_players = frozenset(
+            _normalize_player_name(pick.player.name) for pick in draft_state.picks
+        )
 
         logger.info(f"Found {len(drafted_players)} drafted players to filter out")
 
         # Filter out drafted players
-        available_players = []
-        for player_data in all_position_players:
-            normalized_ranking_name = _normalize_player_name(player_data["name"])
-
-            if normalized_ranking_name not in drafted_players:
-                available_players.append(player_data)
-
-        # Sort by projected_points (descending - higher is better)
-        available_players.sort(key=lambda p: p["projected_points"], reverse=True)
-
-        # Apply limit
-        limited_players = available_players[:limit]
+        available_players = [
+            player_data
+            for player_data in all_position_players
+            if _normalize_player_name(player_data["name"]) not in drafted_players
+        ]
+
+        # Take the top players by projected_points (descending - higher is better)
+        limited_players = heapq.nlargest(
+            limit, available_players, key=_PROJECTED_POINTS_KEY
+        )
 
         logger.info(
             f"get_available_players completed in {time.time() - start_time:.2f} seconds"
         )
         return {
             "success": True,
-            "position": position.upper(),
+            "position": normalized_position,
             "limit": limit,
             "total_available": len(available_players),
             "returned_count": len(limited_players),
@@ -1,5 +1,6 @@
 """Player Rankings tool implementation."""
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional
@@ -15,6 +16,9 @@ logger = logging.getLogger(__name__)
 _rankings_cache = PlayerRankings()
 _cache_timestamp = None
 
+# Serializes scrapes so concurrent cache misses share a single fetch
+_rankings_lock = asyncio.Lock()
+
 
 async def get_player_rankings(
     position: Optional[str] = None, force_refresh: bool = False
@@ -22,6 +26,10 @@ async def get_player_rankings(
     """
     Get player rankings with caching support.
 
+    Cache hits are served without waiting on other callers. Cache misses are
+    serialized, so a burst of requests for an uncached position triggers one
+    FantasySharks scrape and the rest are answered from the refreshed cache.
+
     Args:
         position: Filter by position (QB, RB, WR, TE, K, DST). If None, returns all positions.
         force_refresh: If True, ignore cache and fetch fresh data from FantasySharks
@@ -35,166 +43,20 @@ async def get_player_rankings(
     logger.info(f"Getting player rankings for position: {position or 'all'}")
 
     try:
-        global _cache_timestamp
-
         # Check cache first (unless force refresh)
-        if not force_refresh and _cache_timestamp is not None:
-            cache_age = datetime.now() - _cache_timestamp
-            if cache_age < timedelta(hours=RANKINGS_CACHE_HOURS):
-                # Get cached data
-                if position:
-                    cached_players = _rankings_cache.get_position_data(position.upper())
-                    if cached_players:
-                        logger.info(
-                            f"get_player_rankings (cached) completed in {time.time() - start_time:.2f} seconds"
-                        )
-                        return {
-                            "success": True,
-                            "position_filter": position,
-                            "total_players": len(cached_players),
-                            "last_updated": _cache_timestamp.isoformat(),
-                            "data_source": "FantasySharks",
-                            "cache_hit": True,
-                            "players": [
-                                {
-                                    "name": p.name,
-                                    "team": p.team,
-                                    "position": p.position,
-                                    "bye_week": p.bye_week,
-                                    "ranking": p.ranking,
-                                    "projected_points": p.projected_points,
-                                    "injury_status": p.injury_status.value,
-                                    "notes": p.notes,
-                                }
-                                for p in cached_players
-                            ],
-                        }
-                else:
-                    # Get all cached players
-                    all_players = []
-                    for pos in _rankings_cache.get_all_positions():
-                        pos_players = _rankings_cache.get_position_data(pos)
-                        if pos_players:
-                            all_players.extend(pos_players)
-
-                    if all_players:
-                        logger.info(
-                            f"get_player_rankings (cached) completed in {time.time() - start_time:.2f} seconds"
-                        )
-                        return {
-                            "success": True,
-                            "position_filter": position,
-                            "total_players": len(all_players),
-                            "last_updated": _cache_timestamp.isoformat(),
-                            "data_source": "FantasySharks",
-                            "cache_hit": True,
-                            "players": [
-                                {
-                                    "name": p.name,
-                                    "team": p.team,
-                                    "position": p.position,
-                                    "bye_week": p.bye_week,
-                                    "ranking": p.ranking,
-                                    "projected_points": p.projected_points,
-                                    "injury_status": p.injury_status.value,
-                                    "notes": p.notes,
-                                }
-                                for p in all_players
-                            ],
-                        }
-
-        # Fetch fresh data from FantasySharks
-        logger.info("Fetching fresh rankings from FantasySharks")
-        scraper = FantasySharksScraper()
-
-        try:
-            if position:
-                # Scraper now accepts string positions directly
-                raw_players = await scraper.scrape_rankings(position.upper())
-            else:
-                # Get all draftable positions
-                draftable_positions = ["QB", "RB", "WR", "TE", "K", "DST"]
-                raw_players = []
-                for pos_str in draftable_positions:
-                    pos_players = await scraper.scrape_rankings(pos_str)
-                    raw_players.extend(pos_players)
-        except Exception as e:
-            logger.error(f"Failed to fetch data from FantasySharks: {e}")
-            return {
-                "success": False,
-                "error": f"Failed to fetch rankings from FantasySharks: {str(e)}",
-                "error_type": "scraper_failed",
-                "troubleshooting": {
-                    "problem": "Unable to fetch player rankings from FantasySharks",
-                    "solution": "Check network connection and FantasySharks website availability",
-                    "next_steps": [
-                        "1. Verify internet connection",
-                        "2. Check if FantasySharks.com is accessible",
-                        "3. Try again with force_refresh=True",
-                        "4. Check logs for detailed error information",
-                    ],
-                },
-                "position_filter": position,
-            }
-
-        if not raw_players:
-            logger.warning("No players returned from FantasySharks")
-            return {
-                "success": False,
-                "error": "No player data available from FantasySharks",
-                "error_type": "no_data",
-                "position_filter": position,
-            }
-
-        # Players are already in the correct Pydantic format from scrapers
-        simplified_players = raw_players
-
-        # Cache the new data by position
-        _rankings_cache.clear_cache()
-        positions_cached = set()
-
-        for player in simplified_players:
-            pos = player.position.upper()
-            if pos not in positions_cached:
-                pos_players = [
-                    p for p in simplified_players if p.position.upper() == pos
-                ]
-                _rankings_cache.set_position_data(pos, pos_players)
-                positions_cached.add(pos)
+        if not force_refresh:
+            cached_result = _get_cached_rankings(position, start_time)
+            if cached_result is not None:
+                return cached_result
 
-        _cache_timestamp = datetime.now()
+        async with _rankings_lock:
+            # Another caller may have refreshed the cache while we waited
+            if not force_refresh:
+                cached_result = _get_cached_rankings(position, start_time)
+                if cached_result is not None:
+                    return cached_result
 
-        # Filter by position if requested
-        players_to_return = simplified_players
-        if position:
-            players_to_return = [
-                p for p in simplified_players if p.position.upper() == position.upper()
-            ]
-
-        logger.info(
-            f"get_player_rankings completed in {time.time() - start_time:.2f} seconds"
-        )
-        return {
-            "success": True,
-            "position_filter": position,
-            "total_players": len(players_to_return),
-            "last_updated": _cache_timestamp.isoformat(),
-            "data_source": "FantasySharks",
-            "cache_hit": False,
-            "players": [
-                {
-                    "name": p.name,
-                    "team": p.team,
-                    "position": p.position,
-                    "bye_week": p.bye_week,
-                    "ranking": p.ranking,
-                    "projected_points": p.projected_points,
-                    "injury_status": p.injury_status.value,
-                    "notes": p.notes,
-                }
-                for p in players_to_return
-            ],
-        }
+            return await _scrape_player_rankings(position, start_time)
 
     except Exception as e:
         error_message = str(e)
@@ -218,6 +80,180 @@ async def get_player_rankings(
         }
 
 
+def _get_cached_rankings(
+    position: Optional[str], start_time: float
+) -> Optional[Dict[str, Any]]:
+    """Return the cached rankings response, or None on a cache miss."""
+    import time
+
+    if _cache_timestamp is not None:
+        cache_age = datetime.now() - _cache_timestamp
+        if cache_age < timedelta(hours=RANKINGS_CACHE_HOURS):
+            # Get cached data
+            if position:
+                cached_players = _rankings_cache.get_position_data(position.upper())
+                if cached_players:
+                    logger.info(
+                        f"get_player_rankings (cached) completed in {time.time() - start_time:.2f} seconds"
+                    )
+                    return {
+                        "success": True,
+                        "position_filter": position,
+                        "total_players": len(cached_players),
+                        "last_updated": _cache_timestamp.isoformat(),
+                        "data_source": "FantasySharks",
+                        "cache_hit": True,
+                        "players": [
+                            {
+                                "name": p.name,
+                                "team": p.team,
+                                "position": p.position,
+                                "bye_week": p.bye_week,
+                                "ranking": p.ranking,
+                                "projected_points": p.projected_points,
+                                "injury_status": p.injury_status.value,
+                                "notes": p.notes,
+                            }
+                            for p in cached_players
+                        ],
+                    }
+            else:
+                # Get all cached players
+                all_players = []
+                for pos in _rankings_cache.get_all_positions():
+                    pos_players = _rankings_cache.get_position_data(pos)
+                    if pos_players:
+                        all_players.extend(pos_players)
+
+                if all_players:
+                    logger.info(
+                        f"get_player_rankings (cached) completed in {time.time() - start_time:.2f} seconds"
+                    )
+                    return {
+                        "success": True,
+                        "position_filter": position,
+                        "total_players": len(all_players),
+                        "last_updated": _cache_timestamp.isoformat(),
+                        "data_source": "FantasySharks",
+                        "cache_hit": True,
+                        "players": [
+                            {
+                                "name": p.name,
+                                "team": p.team,
+                                "position": p.position,
+                                "bye_week": p.bye_week,
+                                "ranking": p.ranking,
+                                "projected_points": p.projected_points,
+                                "injury_status": p.injury_status.value,
+                                "notes": p.notes,
+                            }
+                            for p in all_players
+                        ],
+                    }
+
+    return None
+
+
+async def _scrape_player_rankings(
+    position: Optional[str], start_time: float
+) -> Dict[str, Any]:
+    """Scrape fresh rankings from FantasySharks and repopulate the cache."""
+    import time
+
+    global _cache_timestamp
+
+    # Fetch fresh data from FantasySharks
+    logger.info("Fetching fresh rankings from FantasySharks")
+    scraper = FantasySharksScraper()
+
+    try:
+        if position:
+            # Scraper now accepts string positions directly
+            raw_players = await scraper.scrape_rankings(position.upper())
+        else:
+            # Get all draftable positions
+            draftable_positions = ["QB", "RB", "WR", "TE", "K", "DST"]
+            raw_players = []
+            for pos_str in draftable_positions:
+                pos_players = await scraper.scrape_rankings(pos_str)
+                raw_players.extend(pos_players)
+    except Exception as e:
+        logger.error(f"Failed to fetch data from FantasySharks: {e}")
+        return {
+            "success": False,
+            "error": f"Failed to fetch rankings from FantasySharks: {str(e)}",
+            "error_type": "scraper_failed",
+            "troubleshooting": {
+                "problem": "Unable to fetch player rankings from FantasySharks",
+                "solution": "Check network connection and FantasySharks website availability",
+                "next_steps": [
+                    "1. Verify internet connection",
+                    "2. Check if FantasySharks.com is accessible",
+                    "3. Try again with force_refresh=True",
+                    "4. Check logs for detailed error information",
+                ],
+            },
+            "position_filter": position,
+        }
+
+    if not raw_players:
+        logger.warning("No players returned from FantasySharks")
+        return {
+            "success": False,
+            "error": "No player data available from FantasySharks",
+            "error_type": "no_data",
+            "position_filter": position,
+        }
+
+    # Players are already in the correct Pydantic format from scrapers
+    simplified_players = raw_players
+
+    # Cache the new data by position
+    _rankings_cache.clear_cache()
+    positions_cached = set()
+
+    for player in simplified_players:
+        pos = player.position.upper()
+        if pos not in positions_cached:
+            pos_players = [p for p in simplified_players if p.position.upper() == pos]
+            _rankings_cache.set_position_data(pos, pos_players)
+            positions_cached.add(pos)
+
+    _cache_timestamp = datetime.now()
+
+    # Filter by position if requested
+    players_to_return = simplified_players
+    if position:
+        players_to_return = [
+            p for p in simplified_players if p.position.upper() == position.upper()
+        ]
+
+    logger.info(
+        f"get_player_rankings completed in {time.time() - start_time:.2f} seconds"
+    )
+    return {
+        "success": True,
+        "position_filter": position,
+        "total_players": len(players_to_return),
+        "last_updated": _cache_timestamp.isoformat(),
+        "data_source": "FantasySharks",
+        "cache_hit": False,
+        "players": [
+            {
+                "name": p.name,
+                "team": p.team,
+                "position": p.position,
+                "bye_week": p.bye_week,
+                "ranking": p.ranking,
+                "projected_points": p.projected_points,
+                "injury_status": p.injury_status.value,
+                "notes": p.notes,
+            }
+            for p in players_to_return
+        ],
+    }
+
+
 def clear_rankings_cache():
     """Clear the player rankings cache."""
     global _cache_timestamp
@@ -61,11 +61,11 @@ async def get_team_roster(owner_name: str) -> Dict[str, Any]:
                 "error_type": "invalid_draft_state",
             }
 
-        # Find picks by this owner
-        basic_picks: List[Player] = []
-        for pick in draft_picks:
-            if pick.owner.lower() == owner_name.lower():
-                basic_picks.append(pick.player)
+        # Find picks by this owner (case-insensitive)
+        owner_key = owner_name.lower()
+        basic_picks: List[Player] = [
+            pick.player for pick in draft_picks if pick.owner.lower() == owner_key
+        ]
 
         # Enrich player data with rankings information (bye weeks, projections, etc.)
         enriched_picks: List[Player] = []
@@ -1,11 +1,31 @@
 """CSV-based sheets provider for comprehensive integration testing."""
 
 import csv
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, List
+from typing import Any, List, Tuple
 
 from src.services.sheets_service import SheetsProvider
 
+# The range Draft!A1:V24 expects 22 columns (A through V)
+MAX_COLUMNS = 22
+
+
+@lru_cache(maxsize=32)
+def _load_csv_rows(csv_file_path: Path, mtime_ns: int) -> Tuple[Tuple[str, ...], ...]:
+    """Read and normalize a CSV fixture once per version of the file.
+
+    ``mtime_ns`` is only used as part of the cache key, so rewriting the file
+    at the same path invalidates the cached rows.
+    """
+    with open(csv_file_path, "r", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+
+    # Pad rows to ensure consistent column count, truncating if too long
+    return tuple(
+        tuple(row + [""] * (MAX_COLUMNS - len(row)))[:MAX_COLUMNS] for row in rows
+    )
+
 
 class CSVSheetsProvider(SheetsProvider):
     """Sheets provider that reads from CSV files for testing with real Google Sheets format."""
@@ -25,23 +45,15 @@ class CSVSheetsProvider(SheetsProvider):
         - Row 3: Team names
         - Row 4: Headers (Player, Pos, Player, Pos, ...)
         - Row 5+: Draft picks by round
+
+        The file is parsed once per modification time and cached; each call
+        gets fresh lists so callers are free to mutate the rows.
         """
         try:
-            with open(self.csv_file_path, "r", encoding="utf-8") as f:
-                reader = csv.reader(f)
-                rows = [row for row in reader]
-
-                # Ensure we have enough columns to match the range format
-                # The range Draft!A1:V24 expects 22 columns (A through V)
-                max_cols = 22
-                normalized_rows = []
-                for row in rows:
-                    # Pad row to ensure consistent column count
-                    while len(row) < max_cols:
-                        row.append("")
-                    normalized_rows.append(row[:max_cols])  # Truncate if too long
-
-                return normalized_rows
+            rows = _load_csv_rows(
+                self.csv_file_path, self.csv_file_path.stat().st_mtime_ns
+            )
+            return [list(row) for row in rows]
         except Exception as e:
             raise Exception(f"Failed to read CSV fixture: {e}")
 
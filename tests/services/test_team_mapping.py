@@ -1,5 +1,7 @@
 """Tests for team abbreviation mapping functionality."""
 
+import pytest
+
 from src.services.team_mapping import (
     get_all_valid_sheet_teams,
     is_valid_team_abbreviation,
@@ -7,6 +9,44 @@ from src.services.team_mapping import (
     normalize_team_abbreviation,
 )
 
+# All 32 NFL teams in sheets format
+NFL_TEAMS = frozenset(
+    {
+        "ARI",
+        "ATL",
+        "BAL",
+        "BUF",
+        "CAR",
+        "CHI",
+        "CIN",
+        "CLE",
+        "DAL",
+        "DEN",
+        "DET",
+        "GB",
+        "HOU",
+        "IND",
+        "JAC",
+        "KC",
+        "LAC",
+        "LAR",
+        "LV",
+        "MIA",
+        "MIN",
+        "NE",
+        "NO",
+        "NYG",
+        "NYJ",
+        "PHI",
+        "PIT",
+        "SF",
+        "SEA",
+        "TB",
+        "TEN",
+        "WAS",
+    }
+)
+
 
 class TestTeamMapping:
     """Test team abbreviation mapping functionality."""
@@ -94,49 +134,10 @@ class TestTeamMapping:
         assert is_valid_team_abbreviation("sf") is True
         assert is_valid_team_abbreviation("Gb") is True
 
-    def test_comprehensive_team_list(self):
-        """Test that we have mappings for all major NFL teams."""
-        valid_teams = get_all_valid_sheet_teams()
-
-        # Check that we have all 32 NFL teams represented
-        expected_teams = {
-            "ARI",
-            "ATL",
-            "BAL",
-            "BUF",
-            "CAR",
-            "CHI",
-            "CIN",
-            "CLE",
-            "DAL",
-            "DEN",
-            "DET",
-            "GB",
-            "HOU",
-            "IND",
-            "JAC",
-            "KC",
-            "LAC",
-            "LAR",
-            "LV",
-            "MIA",
-            "MIN",
-            "NE",
-            "NO",
-            "NYG",
-            "NYJ",
-            "PHI",
-            "PIT",
-            "SF",
-            "SEA",
-            "TB",
-            "TEN",
-            "WAS",
-        }
-
-        # All expected teams should be in valid teams
-        for team in expected_teams:
-            assert team in valid_teams, f"Team {team} not found in valid teams"
+    @pytest.mark.parametrize("team", sorted(NFL_TEAMS))
+    def test_comprehensive_team_list(self, team):
+        """Test that we have mappings for all 32 NFL teams."""
+        assert team in get_all_valid_sheet_teams()
 
     def test_normalize_position_for_rankings(self):
         """Test position normalization for rankings lookup."""
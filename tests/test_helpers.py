@@ -1,10 +1,42 @@
 """Test helper classes and utilities for Fantasy Football Draft Assistant tests."""
 
-from typing import Any, List
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 from src.services.sheets_service import SheetsProvider
 
 
+class AsyncStub:
+    """Lightweight async stand-in for AsyncMock that records its calls.
+
+    Returns ``return_value`` and appends each call's ``(args, kwargs)`` to
+    ``calls`` so tests can assert on them directly. An exception instance or
+    class ``side_effect`` is raised instead; any other callable is called with
+    the arguments and its result returned.
+    """
+
+    def __init__(
+        self,
+        return_value: Any = None,
+        side_effect: Optional[
+            Union[BaseException, Type[BaseException], Callable[..., Any]]
+        ] = None,
+    ):
+        self.return_value = return_value
+        self.side_effect = side_effect
+        self.calls: List[Tuple[Tuple[Any, ...], Dict[str, Any]]] = []
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append((args, kwargs))
+        if isinstance(self.side_effect, BaseException) or (
+            isinstance(self.side_effect, type)
+            and issubclass(self.side_effect, BaseException)
+        ):
+            raise self.side_effect
+        if self.side_effect is not None:
+            return self.side_effect(*args, **kwargs)
+        return self.return_value
+
+
 class MockSheetsProvider(SheetsProvider):
     """Mock sheets provider for testing"""
 
@@ -1,7 +1,5 @@
 """Tests for available players tool."""
 
-from unittest.mock import patch
-
 import pytest
 
 from src.models.draft_pick import DraftPick
@@ -9,12 +7,39 @@ from src.models.draft_state_simple import DraftState
 from src.models.injury_status import InjuryStatus
 from src.models.player_simple import Player
 from src.tools.available_players import _normalize_player_name, get_available_players
+from tests.test_helpers import AsyncStub
+
+
+def _error_case(
+    error_type,
+    error_text,
+    *,
+    position="QB",
+    limit=5,
+    rankings=None,
+    rankings_error=None,
+    draft_state=None,
+    expects_troubleshooting=False,
+    id=None,
+):
+    """Build an error test case; draft_state=None keeps the mock draft state."""
+    return pytest.param(
+        position,
+        limit,
+        rankings,
+        rankings_error,
+        draft_state,
+        error_type,
+        error_text,
+        expects_troubleshooting,
+        id=id or error_type,
+    )
 
 
 class TestAvailablePlayers:
     """Test available players functionality."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_draft_state(self):
         """Mock draft state with some picks."""
         teams = [
@@ -23,9 +48,9 @@ class TestAvailablePlayers:
         ]
 
         picks = [
-            DraftPick(
+            DraftPick.model_construct(
                 owner="Buffy",
-                player=Player(
+                player=Player.model_construct(
                     name="Josh Allen",
                     team="BUF",
                     position="QB",
@@ -35,9 +60,9 @@ class TestAvailablePlayers:
                     injury_status=InjuryStatus.HEALTHY,
                 ),
             ),
-            DraftPick(
+            DraftPick.model_construct(
                 owner="Willow",
-                player=Player(
+                player=Player.model_construct(
                     name="Christian McCaffrey",
                     team="SF",
                     position="RB",
@@ -49,9 +74,9 @@ class TestAvailablePlayers:
             ),
         ]
 
-        return DraftState(teams=teams, picks=picks)
+        return DraftState.model_construct(teams=teams, picks=picks)
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_rankings_response(self):
         """Mock response from player rankings tool."""
         return {
@@ -100,120 +125,122 @@ class TestAvailablePlayers:
             ],
         }
 
-    @pytest.mark.asyncio
+    @pytest.fixture(autouse=True)
+    def draft_state_stub(self, monkeypatch, mock_draft_state):
+        """Replace the draft state lookup with an async stub of the mock state."""
+        stub = AsyncStub(mock_draft_state)
+        monkeypatch.setattr("src.tools.available_players.get_cached_draft_state", stub)
+        return stub
+
+    @pytest.fixture(autouse=True)
+    def rankings_stub(self, monkeypatch):
+        """Replace the rankings lookup with an async stub."""
+        stub = AsyncStub()
+        monkeypatch.setattr("src.tools.available_players.get_player_rankings", stub)
+        return stub
+
+    @pytest.mark.parametrize(
+        "position,limit,expected_names",
+        [
+            ("QB", 3, ["Lamar Jackson", "Dak Prescott", "Tua Tagovailoa"]),
+            ("QB", 2, ["Lamar Jackson", "Dak Prescott"]),
+            ("qb", 5, ["Lamar Jackson", "Dak Prescott", "Tua Tagovailoa"]),
+        ],
+        ids=["success", "with_limit", "position_case_insensitive"],
+    )
     async def test_get_available_players_success(
-        self, mock_draft_state, mock_rankings_response
+        self,
+        draft_state_stub,
+        rankings_stub,
+        mock_rankings_response,
+        position,
+        limit,
+        expected_names,
     ):
         """Test successful retrieval of available players."""
 
-        with patch("src.tools.available_players.get_player_rankings") as mock_rankings:
-            with patch(
-                "src.tools.available_players.get_cached_draft_state"
-            ) as mock_draft:
-                mock_rankings.return_value = mock_rankings_response
-                mock_draft.return_value = mock_draft_state
-
-                result = await get_available_players(position="QB", limit=3)
-
-                assert result["success"] is True
-                assert result["position"] == "QB"
-                assert result["limit"] == 3
-                assert (
-                    result["total_available"] == 3
-                )  # 4 total - 1 drafted (Josh Allen)
-                assert result["returned_count"] == 3
-
-                # Check that Josh Allen is filtered out (he was drafted)
-                player_names = [p["name"] for p in result["players"]]
-                assert "Josh Allen" not in player_names
-                assert "Lamar Jackson" in player_names
-                assert "Dak Prescott" in player_names
-                assert "Tua Tagovailoa" in player_names
-
-                # Should be sorted by projected_points (descending)
-                players = result["players"]
-                assert players[0]["name"] == "Lamar Jackson"  # 96.0 points
-                assert players[1]["name"] == "Dak Prescott"  # 90.0 points
-                assert players[2]["name"] == "Tua Tagovailoa"  # 85.0 points
-
-                # Verify rankings was called with correct position
-                mock_rankings.assert_called_once_with(position="QB")
-                # Verify draft state was fetched
-                mock_draft.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_get_available_players_with_limit(
-        self, mock_draft_state, mock_rankings_response
+        rankings_stub.return_value = mock_rankings_response
+
+        result = await get_available_players(position=position, limit=limit)
+
+        assert result["success"] is True
+        assert result["position"] == "QB"
+        assert result["limit"] == limit
+        assert result["total_available"] == 3  # 4 total - 1 drafted (Josh Allen)
+        assert result["returned_count"] == len(expected_names)
+
+        # Josh Allen is filtered out (he was drafted) and the rest are
+        # sorted by projected_points (descending) up to the limit
+        player_names = [p["name"] for p in result["players"]]
+        assert "Josh Allen" not in player_names
+        assert player_names == expected_names
+
+        # Result includes draft context (Buffy and Willow made picks)
+        assert result["draft_context"] == {"total_picks_made": 2, "total_teams": 2}
+
+        # Verify rankings was called with the uppercased position
+        assert rankings_stub.calls == [((), {"position": "QB"})]
+        # Verify draft state was fetched
+        assert len(draft_state_stub.calls) == 1
+
+    @pytest.mark.parametrize(
+        "position,limit,rankings,rankings_error,draft_state,"
+        "error_type,error_text,expects_troubleshooting",
+        [
+            _error_case(
+                "invalid_position",
+                "Valid positions: ['QB', 'RB', 'WR', 'TE', 'K', 'DST']",
+                position="INVALID",
+            ),
+            _error_case("invalid_limit", "must be greater than 0", limit=0),
+            _error_case(
+                "rankings_failed",
+                "Network error",
+                rankings={"success": False, "error": "Network error"},
+                id="rankings_fail",
+            ),
+            _error_case(
+                "draft_state_failed",
+                "Sheet access denied",
+                draft_state={"success": False, "error": "Sheet access denied"},
+                id="draft_state_fail",
+            ),
+            _error_case(
+                "unexpected_error",
+                "Network request failed",
+                rankings_error=Exception("Network request failed"),
+                expects_troubleshooting=True,
+            ),
+        ],
+    )
+    async def test_get_available_players_errors(
+        self,
+        draft_state_stub,
+        rankings_stub,
+        mock_draft_state,
+        position,
+        limit,
+        rankings,
+        rankings_error,
+        draft_state,
+        error_type,
+        error_text,
+        expects_troubleshooting,
     ):
-        """Test that limit parameter works correctly."""
-
-        with patch("src.tools.available_players.get_player_rankings") as mock_rankings:
-            with patch(
-                "src.tools.available_players.get_cached_draft_state"
-            ) as mock_draft:
-                mock_rankings.return_value = mock_rankings_response
-                mock_draft.return_value = mock_draft_state
-
-                result = await get_available_players(position="QB", limit=2)
-
-                assert result["success"] is True
-                assert result["limit"] == 2
-                assert result["returned_count"] == 2
-                assert result["total_available"] == 3  # Total available before limit
-
-                # Should only return top 2
-                assert len(result["players"]) == 2
-                assert result["players"][0]["name"] == "Lamar Jackson"
-                assert result["players"][1]["name"] == "Dak Prescott"
-
-    @pytest.mark.asyncio
-    async def test_get_available_players_invalid_position(self, mock_draft_state):
-        """Test error handling for invalid position."""
+        """Test each failure path reports its error type and message."""
 
-        with patch("src.tools.available_players.get_cached_draft_state") as mock_draft:
-            mock_draft.return_value = mock_draft_state
+        draft_state_stub.return_value = draft_state or mock_draft_state
+        rankings_stub.return_value = rankings
+        rankings_stub.side_effect = rankings_error
 
-            result = await get_available_players(position="INVALID", limit=5)
+        result = await get_available_players(position=position, limit=limit)
 
-            assert result["success"] is False
-            assert result["error_type"] == "invalid_position"
-            assert "Invalid position" in result["error"]
+        assert result["success"] is False
+        assert result["error_type"] == error_type
+        assert error_text in result["error"]
+        assert ("troubleshooting" in result) is expects_troubleshooting
 
-    @pytest.mark.asyncio
-    async def test_get_available_players_invalid_limit(self, mock_draft_state):
-        """Test error handling for invalid limit."""
-
-        with patch("src.tools.available_players.get_cached_draft_state") as mock_draft:
-            mock_draft.return_value = mock_draft_state
-
-            result = await get_available_players(position="QB", limit=0)
-
-            assert result["success"] is False
-            assert result["error_type"] == "invalid_limit"
-            assert "must be greater than 0" in result["error"]
-
-    @pytest.mark.asyncio
-    async def test_get_available_players_rankings_fail(self, mock_draft_state):
-        """Test handling when player rankings fails."""
-
-        with patch("src.tools.available_players.get_player_rankings") as mock_rankings:
-            with patch(
-                "src.tools.available_players.get_cached_draft_state"
-            ) as mock_draft:
-                mock_rankings.return_value = {
-                    "success": False,
-                    "error": "Network error",
-                }
-                mock_draft.return_value = mock_draft_state
-
-                result = await get_available_players(position="QB", limit=5)
-
-                assert result["success"] is False
-                assert result["error_type"] == "rankings_failed"
-                assert "Network error" in result["error"]
-
-    @pytest.mark.asyncio
-    async def test_get_available_players_all_drafted(self, mock_draft_state):
+    async def test_get_available_players_all_drafted(self, rankings_stub):
         """Test when all players in rankings have been drafted."""
 
         # Mock rankings with only drafted players
@@ -233,36 +260,17 @@ class TestAvailablePlayers:
             ],
         }
 
-        with patch("src.tools.available_players.get_player_rankings") as mock_rankings:
-            with patch(
-                "src.tools.available_players.get_cached_draft_state"
-            ) as mock_draft:
-                mock_rankings.return_value = drafted_only_response
-                mock_draft.return_value = mock_draft_state
-
-                result = await get_available_players(position="QB", limit=5)
-
-                assert result["success"] is True
-                assert result["total_available"] == 0
-                assert result["returned_count"] == 0
-                assert len(result["players"]) == 0
-
-    @pytest.mark.asyncio
-    async def test_get_available_players_draft_state_fail(self):
-        """Test handling when draft state fetch fails."""
-
-        with patch("src.tools.available_players.get_cached_draft_state") as mock_draft:
-            mock_draft.return_value = {"success": False, "error": "Sheet access denied"}
+        rankings_stub.return_value = drafted_only_response
 
-            result = await get_available_players(position="QB", limit=5)
+        result = await get_available_players(position="QB", limit=5)
 
-            assert result["success"] is False
-            assert result["error_type"] == "draft_state_failed"
-            assert "Sheet access denied" in result["error"]
+        assert result["success"] is True
+        assert result["total_available"] == 0
+        assert result["returned_count"] == 0
+        assert len(result["players"]) == 0
 
-    @pytest.mark.asyncio
     async def test_get_available_players_case_insensitive_matching(
-        self, mock_rankings_response
+        self, draft_state_stub, rankings_stub, mock_rankings_response
     ):
         """Test case-insensitive player name matching."""
 
@@ -284,112 +292,46 @@ class TestAvailablePlayers:
         ]
         draft_state = DraftState(teams=teams, picks=picks)
 
-        with patch("src.tools.available_players.get_player_rankings") as mock_rankings:
-            with patch(
-                "src.tools.available_players.get_cached_draft_state"
-            ) as mock_draft:
-                mock_rankings.return_value = mock_rankings_response
-                mock_draft.return_value = draft_state
-
-                result = await get_available_players(position="QB", limit=5)
-
-                # "Josh Allen" should still be filtered out despite case difference
-                player_names = [p["name"] for p in result["players"]]
-                assert "Josh Allen" not in player_names
-                assert len(result["players"]) == 3
-
-    @pytest.mark.asyncio
-    async def test_get_available_players_unexpected_error(self, mock_draft_state):
-        """Test handling of unexpected errors."""
-
-        with patch("src.tools.available_players.get_player_rankings") as mock_rankings:
-            with patch(
-                "src.tools.available_players.get_cached_draft_state"
-            ) as mock_draft:
-                mock_rankings.side_effect = Exception("Network request failed")
-                mock_draft.return_value = mock_draft_state
-
-                result = await get_available_players(position="QB", limit=5)
-
-                assert result["success"] is False
-                assert result["error_type"] == "unexpected_error"
-                assert "Network request failed" in result["error"]
-                assert "troubleshooting" in result
-
-    def test_normalize_player_name(self):
+        draft_state_stub.return_value = draft_state
+        rankings_stub.return_value = mock_rankings_response
+
+        result = await get_available_players(position="QB", limit=5)
+
+        # "Josh Allen" should still be filtered out despite case difference
+        player_names = {p["name"] for p in result["players"]}
+        assert "Josh Allen" not in player_names
+        assert len(result["players"]) == 3
+
+    @pytest.mark.parametrize(
+        "raw_name,expected",
+        [
+            # Basic normalization
+            ("Josh Allen", "josh allen"),
+            ("JOSH ALLEN", "josh allen"),
+            # Punctuation removal
+            ("D'Andre Swift", "dandre swift"),
+            ("T.J. Hockenson", "tj hockenson"),
+            ("Gabe Davis-Jones", "gabe davisjones"),
+            # Suffix removal
+            ("Kenneth Walker III", "kenneth walker"),
+            ("Marvin Harrison Jr", "marvin harrison"),
+            ("Dale Earnhardt Sr", "dale earnhardt"),
+            # Suffixes are only stripped as whole words
+            ("Chris Ivory", "chris ivory"),
+            # Extra whitespace
+            ("  Josh   Allen  ", "josh allen"),
+        ],
+    )
+    def test_normalize_player_name(self, raw_name, expected):
         """Test player name normalization."""
+        assert _normalize_player_name(raw_name) == expected
 
-        # Test basic normalization
-        assert _normalize_player_name("Josh Allen") == "josh allen"
-        assert _normalize_player_name("JOSH ALLEN") == "josh allen"
-
-        # Test punctuation removal
-        assert _normalize_player_name("D'Andre Swift") == "dandre swift"
-        assert _normalize_player_name("T.J. Hockenson") == "tj hockenson"
-        assert _normalize_player_name("Gabe Davis-Jones") == "gabe davisjones"
-
-        # Test suffix removal
-        assert _normalize_player_name("Kenneth Walker III") == "kenneth walker"
-        assert _normalize_player_name("Marvin Harrison Jr") == "marvin harrison"
-        assert _normalize_player_name("Dale Earnhardt Sr") == "dale earnhardt"
-
-        # Test extra whitespace
-        assert _normalize_player_name("  Josh   Allen  ") == "josh allen"
-
-    @pytest.mark.asyncio
-    async def test_get_available_players_position_case_insensitive(
-        self, mock_draft_state, mock_rankings_response
-    ):
-        """Test position parameter is case insensitive."""
-
-        with patch("src.tools.available_players.get_player_rankings") as mock_rankings:
-            with patch(
-                "src.tools.available_players.get_cached_draft_state"
-            ) as mock_draft:
-                mock_rankings.return_value = mock_rankings_response
-                mock_draft.return_value = mock_draft_state
-
-                # Test lowercase
-                result = await get_available_players(position="qb", limit=5)
-
-                assert result["success"] is True
-                assert result["position"] == "QB"
-
-                # Verify uppercase was passed to rankings
-                mock_rankings.assert_called_with(position="QB")
-
-    @pytest.mark.asyncio
-    async def test_get_available_players_includes_context(
-        self, mock_draft_state, mock_rankings_response
+    async def test_get_available_players_with_clean_names(
+        self, draft_state_stub, rankings_stub
     ):
-        """Test that result includes draft context information."""
-
-        with patch("src.tools.available_players.get_player_rankings") as mock_rankings:
-            with patch(
-                "src.tools.available_players.get_cached_draft_state"
-            ) as mock_draft:
-                mock_rankings.return_value = mock_rankings_response
-                mock_draft.return_value = mock_draft_state
-
-                result = await get_available_players(position="QB", limit=5)
-
-                assert result["success"] is True
-                assert "draft_context" in result
-
-                context = result["draft_context"]
-                assert context["total_picks_made"] == 2  # Buffy and Willow made picks
-                assert context["total_teams"] == 2
-
-    @pytest.mark.asyncio
-    async def test_get_available_players_with_clean_names(self):
         """Test available players filtering works correctly with clean player names."""
 
         # Create draft state with clean names (no team abbreviations)
-        from src.models.draft_pick import DraftPick
-        from src.models.draft_state_simple import DraftState
-        from src.models.injury_status import InjuryStatus
-        from src.models.player_simple import Player
-
         picks = [
             DraftPick(
                 player=Player(
@@ -463,27 +405,21 @@ class TestAvailablePlayers:
             ],
         }
 
-        with patch("src.tools.available_players.get_player_rankings") as mock_rankings:
-            with patch(
-                "src.tools.available_players.get_cached_draft_state"
-            ) as mock_draft:
-                mock_rankings.return_value = rankings_response
-                mock_draft.return_value = draft_state
-
-                result = await get_available_players("QB", 5)
-
-                assert result["success"] is True
-                assert result["total_available"] == 1  # Only Jayden Daniels available
-                assert result["returned_count"] == 1
-
-                # Verify Josh Allen and Lamar Jackson are NOT in available players
-                available_names = {p["name"] for p in result["players"]}
-                assert (
-                    "Josh Allen" not in available_names
-                ), "Josh Allen should be filtered out (already drafted)"
-                assert (
-                    "Lamar Jackson" not in available_names
-                ), "Lamar Jackson should be filtered out (already drafted)"
-                assert (
-                    "Jayden Daniels" in available_names
-                ), "Jayden Daniels should be available"
+        draft_state_stub.return_value = draft_state
+        rankings_stub.return_value = rankings_response
+
+        result = await get_available_players("QB", 5)
+
+        assert result["success"] is True
+        assert result["total_available"] == 1  # Only Jayden Daniels available
+        assert result["returned_count"] == 1
+
+        # Verify Josh Allen and Lamar Jackson are NOT in available players
+        available_names = {p["name"] for p in result["players"]}
+        assert (
+            "Josh Allen" not in available_names
+        ), "Josh Allen should be filtered out (already drafted)"
+        assert (
+            "Lamar Jackson" not in available_names
+        ), "Lamar Jackson should be filtered out (already drafted)"
+        assert "Jayden Daniels" in available_names, "Jayden Daniels should be available"
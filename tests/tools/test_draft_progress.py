@@ -1,30 +1,34 @@
 """Tests for draft progress tool with proper caching support."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
 
 import pytest
 
+from src.config import DEFAULT_SHEET_ID, DRAFT_SHEET_RANGE
 from src.models.draft_pick import DraftPick
 from src.models.draft_state_simple import DraftState
 from src.models.injury_status import InjuryStatus
 from src.models.player_simple import Player
 from src.tools.draft_progress import read_draft_progress
+from tests.test_helpers import AsyncStub
+
+EXPECTED_TEAMS = [
+    {"team_name": "Sunnydale Slayers", "owner": "Buffy"},
+    {"team_name": "Willow's Witches", "owner": "Willow"},
+]
 
 
 class TestDraftProgress:
     """Test suite for draft progress tool with caching."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_draft_state(self):
         """Create a mock DraftState for testing."""
-        teams = [
-            {"team_name": "Sunnydale Slayers", "owner": "Buffy"},
-            {"team_name": "Willow's Witches", "owner": "Willow"},
-        ]
+        teams = [dict(t) for t in EXPECTED_TEAMS]
 
         picks = [
-            DraftPick(
-                player=Player(
+            DraftPick.model_construct(
+                player=Player.model_construct(
                     name="Josh Allen",
                     team="BUF",
                     position="QB",
@@ -36,8 +40,8 @@ class TestDraftProgress:
                 ),
                 owner="Buffy",
             ),
-            DraftPick(
-                player=Player(
+            DraftPick.model_construct(
+                player=Player.model_construct(
                     name="Christian McCaffrey",
                     team="SF",
                     position="RB",
@@ -51,102 +55,136 @@ class TestDraftProgress:
             ),
         ]
 
-        return DraftState(teams=teams, picks=picks)
+        return DraftState.model_construct(teams=teams, picks=picks)
 
-    @pytest.mark.asyncio
-    async def test_read_draft_progress_success(self, mock_draft_state):
+    @pytest.fixture(autouse=True)
+    def draft_state_stub(self, monkeypatch, mock_draft_state):
+        """Replace the draft state cache lookup with an async stub."""
+        stub = AsyncStub(mock_draft_state)
+        monkeypatch.setattr(
+            "src.services.draft_state_cache.get_cached_draft_state", stub
+        )
+        return stub
+
+    async def test_read_draft_progress_success(self, draft_state_stub):
         """Test successful draft progress read using cache."""
-        with patch(
-            "src.services.draft_state_cache.get_cached_draft_state"
-        ) as mock_cache:
-            mock_cache.return_value = mock_draft_state
-
-            result = await read_draft_progress()
-
-            # Should return DraftState object
-            assert isinstance(result, DraftState)
-            assert len(result.teams) == 2
-            assert len(result.picks) == 2
-
-            # Verify cache was called correctly
-            mock_cache.assert_called_once()
-
-            # Check teams data
-            teams = result.teams
-            assert teams[0]["team_name"] == "Sunnydale Slayers"
-            assert teams[0]["owner"] == "Buffy"
-            assert teams[1]["owner"] == "Willow"
-
-            # Check picks data
-            picks = result.picks
-            pick1 = picks[0]
-            assert pick1.owner == "Buffy"
-            assert pick1.player.name == "Josh Allen"
-            assert pick1.player.position == "QB"
-            assert pick1.player.team == "BUF"
-
-            pick2 = picks[1]
-            assert pick2.owner == "Willow"
-            assert pick2.player.name == "Christian McCaffrey"
-            assert pick2.player.position == "RB"
-
-    @pytest.mark.asyncio
-    async def test_read_draft_progress_force_refresh(self, mock_draft_state):
+        result = await read_draft_progress()
+
+        # Should return DraftState object
+        assert isinstance(result, DraftState)
+        assert len(result.teams) == 2
+        assert len(result.picks) == 2
+
+        # Verify cache was called correctly
+        assert draft_state_stub.calls == [((), {})]
+
+        # Check teams data
+        assert result.teams == EXPECTED_TEAMS
+
+        # Check picks data
+        assert [
+            (pick.owner, pick.player.name, pick.player.position, pick.player.team)
+            for pick in result.picks
+        ] == [
+            ("Buffy", "Josh Allen", "QB", "BUF"),
+            ("Willow", "Christian McCaffrey", "RB", "SF"),
+        ]
+
+    async def test_read_draft_progress_force_refresh(
+        self, monkeypatch, mock_draft_state
+    ):
         """Test force refresh bypasses cache."""
-        with patch(
-            "src.tools.draft_progress.GoogleSheetsProvider"
-        ) as mock_provider_class:
-            mock_provider = MagicMock()
-            mock_provider_class.return_value = mock_provider
-
-            with patch("src.tools.draft_progress.SheetsService") as mock_service_class:
-                mock_service = AsyncMock()
-                mock_service.read_draft_data.return_value = mock_draft_state
-                mock_service_class.return_value = mock_service
-
-                result = await read_draft_progress(force_refresh=True)
-
-                # Should return DraftState object
-                assert isinstance(result, DraftState)
-                assert len(result.teams) == 2
-
-                # Verify sheets service was called directly (bypassing cache)
-                mock_service_class.assert_called_once()
-                # Verify service was used with config-based parameters
-                mock_service.read_draft_data.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_read_draft_progress_missing_dependencies(self):
-        """Test handling of missing Google Sheets dependencies with force refresh."""
-        with patch(
-            "src.tools.draft_progress.GoogleSheetsProvider"
-        ) as mock_provider_class:
-            mock_provider_class.side_effect = ImportError("Google API not available")
-
-            result = await read_draft_progress(force_refresh=True)
-
-            # Should return error dict
-            assert isinstance(result, dict)
-            assert result["success"] is False
-            assert result["error_type"] == "missing_dependencies"
-            assert "Google Sheets API not available" in result["error"]
-
-    @pytest.mark.asyncio
-    async def test_read_draft_progress_config_based(self, mock_draft_state):
-        """Test that configuration is used for sheet parameters."""
-        with patch(
-            "src.services.draft_state_cache.get_cached_draft_state"
-        ) as mock_cache:
-            mock_cache.return_value = mock_draft_state
+        read_draft_data = AsyncStub(mock_draft_state)
+        service_providers = []
+
+        def sheets_service_stub(provider):
+            service_providers.append(provider)
+            return SimpleNamespace(read_draft_data=read_draft_data)
+
+        provider = object()
+        monkeypatch.setattr(
+            "src.tools.draft_progress.GoogleSheetsProvider", lambda: provider
+        )
+        monkeypatch.setattr(
+            "src.tools.draft_progress.SheetsService", sheets_service_stub
+        )
+
+        result = await read_draft_progress(force_refresh=True)
+
+        # Should return DraftState object
+        assert isinstance(result, DraftState)
+        assert len(result.teams) == 2
+
+        # Verify sheets service was built directly (bypassing cache)
+        assert service_providers == [provider]
+        # Verify service was used with config-based parameters
+        assert read_draft_data.calls == [
+            ((DEFAULT_SHEET_ID, DRAFT_SHEET_RANGE), {"force_refresh": True})
+        ]
 
-            result = await read_draft_progress()
+    @pytest.mark.parametrize(
+        "provider_error,read_error,error_type,error_text",
+        [
+            pytest.param(
+                ImportError("Google API not available"),
+                None,
+                "missing_dependencies",
+                "Google Sheets API not available",
+                id="missing_dependencies",
+            ),
+            pytest.param(
+                None,
+                Exception("403 Forbidden: caller does not have permission"),
+                "sheet_access_failed",
+                "403 Forbidden",
+                id="permission_denied",
+            ),
+            pytest.param(
+                None,
+                Exception("404 Not Found: requested entity was not found"),
+                "sheet_access_failed",
+                "404 Not Found",
+                id="sheet_not_found",
+            ),
+        ],
+    )
+    async def test_read_draft_progress_force_refresh_errors(
+        self, monkeypatch, provider_error, read_error, error_type, error_text
+    ):
+        """Test force refresh failures are returned as error dicts."""
+
+        def provider_stub():
+            if provider_error is not None:
+                raise provider_error
+            return object()
+
+        monkeypatch.setattr(
+            "src.tools.draft_progress.GoogleSheetsProvider", provider_stub
+        )
+        monkeypatch.setattr(
+            "src.tools.draft_progress.SheetsService",
+            lambda provider: SimpleNamespace(
+                read_draft_data=AsyncStub(side_effect=read_error)
+            ),
+        )
+
+        result = await read_draft_progress(force_refresh=True)
 
-            assert isinstance(result, DraftState)
-            # Verify cache was called (config determines sheet_id and range)
-            mock_cache.assert_called_once()
+        # Should return error dict
+        assert isinstance(result, dict)
+        assert result["success"] is False
+        assert result["error_type"] == error_type
+        assert error_text in result["error"]
 
-    @pytest.mark.asyncio
-    async def test_read_draft_progress_cache_error(self):
+    async def test_read_draft_progress_config_based(self, draft_state_stub):
+        """Test that configuration is used for sheet parameters."""
+        result = await read_draft_progress()
+
+        assert isinstance(result, DraftState)
+        # Verify cache was called (config determines sheet_id and range)
+        assert draft_state_stub.calls == [((), {})]
+
+    async def test_read_draft_progress_cache_error(self, draft_state_stub):
         """Test handling of cache errors."""
         error_result = {
             "success": False,
@@ -156,25 +194,18 @@ class TestDraftProgress:
             "sheet_range": "Draft!A1:V24",
         }
 
-        with patch(
-            "src.services.draft_state_cache.get_cached_draft_state"
-        ) as mock_cache:
-            mock_cache.return_value = error_result
+        draft_state_stub.return_value = error_result
 
-            result = await read_draft_progress()
+        result = await read_draft_progress()
 
-            # Should return error dict from cache
-            assert isinstance(result, dict)
-            assert result["success"] is False
-            assert result["error"] == "Sheet not found"
+        # Should return error dict from cache
+        assert isinstance(result, dict)
+        assert result["success"] is False
+        assert result["error"] == "Sheet not found"
 
-    @pytest.mark.asyncio
-    async def test_read_draft_progress_with_composite_names(self):
+    async def test_read_draft_progress_with_composite_names(self, draft_state_stub):
         """Test handling of composite player names (with team abbreviations)."""
-        teams = [
-            {"team_name": "Sunnydale Slayers", "owner": "Buffy"},
-            {"team_name": "Willow's Witches", "owner": "Willow"},
-        ]
+        teams = [dict(t) for t in EXPECTED_TEAMS]
 
         # Create players with parsed names (team extracted from composite name)
         picks = [
@@ -208,36 +239,28 @@ class TestDraftProgress:
 
         expected_draft_state = DraftState(teams=teams, picks=picks)
 
-        with patch(
-            "src.services.draft_state_cache.get_cached_draft_state"
-        ) as mock_cache:
-            mock_cache.return_value = expected_draft_state
+        draft_state_stub.return_value = expected_draft_state
 
-            result = await read_draft_progress()
+        result = await read_draft_progress()
 
-            # Should return DraftState object for success
-            assert isinstance(result, DraftState)
-            assert len(result.picks) == 2
+        # Should return DraftState object for success
+        assert isinstance(result, DraftState)
+        assert len(result.picks) == 2
 
-            # Verify team extraction worked
-            picks = result.picks
-            assert picks[0].player.name == "Josh Allen"
-            assert picks[0].player.team == "BUF"
-            assert picks[1].player.name == "Lamar Jackson"
-            assert picks[1].player.team == "BAL"
+        # Verify team extraction worked
+        assert [(pick.player.name, pick.player.team) for pick in result.picks] == [
+            ("Josh Allen", "BUF"),
+            ("Lamar Jackson", "BAL"),
+        ]
 
-    @pytest.mark.asyncio
-    async def test_read_draft_progress_empty_data(self):
+    async def test_read_draft_progress_empty_data(self, draft_state_stub):
         """Test handling of empty draft data."""
         empty_draft_state = DraftState(picks=[], teams=[])
 
-        with patch(
-            "src.services.draft_state_cache.get_cached_draft_state"
-        ) as mock_cache:
-            mock_cache.return_value = empty_draft_state
+        draft_state_stub.return_value = empty_draft_state
 
-            result = await read_draft_progress()
+        result = await read_draft_progress()
 
-            assert isinstance(result, DraftState)
-            assert len(result.picks) == 0
-            assert len(result.teams) == 0
+        assert isinstance(result, DraftState)
+        assert len(result.picks) == 0
+        assert len(result.teams) == 0
@@ -1,22 +1,59 @@
-from unittest.mock import patch
+import asyncio
 
 import pytest
 
 from src.tools import (
+    clear_rankings_cache,
     get_player_rankings,
 )
 from tests.test_fixtures import FixtureFantasySharksScraper
 
+RANKED_PLAYER_FIELDS = frozenset(
+    {"name", "position", "team", "bye_week", "ranking", "projected_points"}
+)
+
+
+class CountingFantasySharksScraper(FixtureFantasySharksScraper):
+    """Fixture scraper that counts how many times rankings are scraped."""
+
+    scrape_count = 0
+
+    async def scrape_rankings(self, position=None):
+        CountingFantasySharksScraper.scrape_count += 1
+        await asyncio.sleep(0)  # Yield like a real network request would
+        return await super().scrape_rankings(position)
+
+
+class BlockingFantasySharksScraper(FixtureFantasySharksScraper):
+    """Fixture scraper that holds each scrape open until released."""
+
+    started: asyncio.Event
+    release: asyncio.Event
+
+    async def scrape_rankings(self, position=None):
+        BlockingFantasySharksScraper.started.set()
+        await BlockingFantasySharksScraper.release.wait()
+        return await super().scrape_rankings(position)
+
 
 class TestGetPlayerRankings:
-    @pytest.mark.asyncio
-    async def test_get_player_rankings_success(self):
-        # Use fixture scraper to avoid network requests in CI
-        with patch(
+    @pytest.fixture(autouse=True)
+    def fixture_scraper(self, monkeypatch):
+        """Serve rankings from the saved FantasySharks page so no test hits the network"""
+        monkeypatch.setattr(
             "src.tools.player_rankings.FantasySharksScraper",
             FixtureFantasySharksScraper,
-        ):
-            result = await get_player_rankings(force_refresh=True)
+        )
+
+    @pytest.fixture(autouse=True)
+    def isolated_rankings_cache(self):
+        """Start and finish each test with an empty rankings cache"""
+        clear_rankings_cache()
+        yield
+        clear_rankings_cache()
+
+    async def test_get_player_rankings_success(self):
+        result = await get_player_rankings(force_refresh=True)
 
         assert result["success"]
         assert "players" in result
@@ -25,22 +62,11 @@ class TestGetPlayerRankings:
         # Should have players from fixture
         assert result["players"]
         # Check player structure
-        first_player = result["players"][0]
-        assert "name" in first_player
-        assert "position" in first_player
-        assert "team" in first_player
-        assert "bye_week" in first_player
-        assert "ranking" in first_player
-        assert "projected_points" in first_player
-
-    @pytest.mark.asyncio
+        missing_fields = RANKED_PLAYER_FIELDS - result["players"][0].keys()
+        assert not missing_fields, f"Missing player fields: {missing_fields}"
+
     async def test_get_player_rankings_with_position_filter(self):
-        # Use fixture scraper to avoid network requests in CI
-        with patch(
-            "src.tools.player_rankings.FantasySharksScraper",
-            FixtureFantasySharksScraper,
-        ):
-            result = await get_player_rankings(position="QB", force_refresh=True)
+        result = await get_player_rankings(position="QB", force_refresh=True)
 
         assert result["success"]
         assert result["position_filter"] == "QB"
@@ -57,7 +83,6 @@ class TestGetPlayerRankings:
         player_names = [p["name"] for p in players]
         assert "Josh Allen" in player_names
 
-    @pytest.mark.asyncio
     async def test_get_player_rankings_invalid_position(self):
         """Test error handling for invalid position"""
         result = await get_player_rankings(position="INVALID")
@@ -65,7 +90,6 @@ class TestGetPlayerRankings:
         assert not result["success"]
         assert "error" in result
 
-    @pytest.mark.asyncio
     async def test_get_player_rankings_force_refresh(self):
         """Test force refresh functionality"""
         result = await get_player_rankings(force_refresh=True)
@@ -73,6 +97,52 @@ class TestGetPlayerRankings:
         # Should still succeed whether data is available or not
         assert "success" in result
 
+    async def test_get_player_rankings_concurrent_calls_share_one_scrape(
+        self, monkeypatch
+    ):
+        """Concurrent cache misses for a position should scrape only once"""
+        monkeypatch.setattr(CountingFantasySharksScraper, "scrape_count", 0)
+        monkeypatch.setattr(
+            "src.tools.player_rankings.FantasySharksScraper",
+            CountingFantasySharksScraper,
+        )
+
+        results = await asyncio.gather(
+            *(get_player_rankings(position="QB") for _ in range(3))
+        )
+
+        assert CountingFantasySharksScraper.scrape_count == 1
+        assert all(result["success"] for result in results)
+        assert [result["cache_hit"] for result in results] == [False, True, True]
+
+    async def test_get_player_rankings_cache_hit_not_blocked_by_scrape(
+        self, monkeypatch
+    ):
+        """A cached position is served while another position is being scraped"""
+        await get_player_rankings(position="QB")
+
+        for event_name in ("started", "release"):
+            monkeypatch.setattr(
+                BlockingFantasySharksScraper, event_name, asyncio.Event(), raising=False
+            )
+        monkeypatch.setattr(
+            "src.tools.player_rankings.FantasySharksScraper",
+            BlockingFantasySharksScraper,
+        )
+
+        scrape = asyncio.create_task(get_player_rankings(position="RB"))
+        await BlockingFantasySharksScraper.started.wait()
+        try:
+            result = await asyncio.wait_for(
+                get_player_rankings(position="QB"), timeout=1
+            )
+        finally:
+            BlockingFantasySharksScraper.release.set()
+            await scrape
+
+        assert result["success"]
+        assert result["cache_hit"] is True
+
 
 # Only testing the simplified player rankings tool.
 # The deprecated analyze_available_players and suggest_draft_pick tools
@@ -1,8 +1,5 @@
 """Tests for team roster tool."""
 
-import logging
-from unittest.mock import patch
-
 import pytest
 
 from src.models.draft_pick import DraftPick
@@ -10,12 +7,48 @@ from src.models.draft_state_simple import DraftState
 from src.models.injury_status import InjuryStatus
 from src.models.player_simple import Player
 from src.tools.team_roster import get_team_roster
+from tests.test_helpers import AsyncStub
+
+# Rankings returned by the patched get_player_rankings, keyed by position
+QB_RANKINGS = {
+    "success": True,
+    "players": [
+        {
+            "name": "Josh Allen",
+            "team": "BUF",
+            "position": "QB",
+            "bye_week": 12,
+            "ranking": 1,
+            "projected_points": 99.0,
+            "notes": "Elite QB",
+        }
+    ],
+}
+
+RB_RANKINGS = {
+    "success": True,
+    "players": [
+        {
+            "name": "Christian McCaffrey",
+            "team": "SF",
+            "position": "RB",
+            "bye_week": 9,
+            "ranking": 2,
+            "projected_points": 98.0,
+            "notes": "Workhorse RB",
+        }
+    ],
+}
+
+EMPTY_RANKINGS = {"success": True, "players": []}
+
+RANKINGS_BY_POSITION = {"QB": QB_RANKINGS, "RB": RB_RANKINGS}
 
 
 class TestTeamRoster:
     """Test team roster functionality."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_draft_state(self):
         """Mock draft state with multiple owners and picks."""
         teams = [
@@ -25,9 +58,9 @@ class TestTeamRoster:
         ]
 
         picks = [
-            DraftPick(
+            DraftPick.model_construct(
                 owner="Buffy",
-                player=Player(
+                player=Player.model_construct(
                     name="Josh Allen",
                     team="BUF",
                     position="QB",
@@ -38,9 +71,9 @@ class TestTeamRoster:
                     notes="Elite QB",
                 ),
             ),
-            DraftPick(
+            DraftPick.model_construct(
                 owner="Buffy",
-                player=Player(
+                player=Player.model_construct(
                     name="Christian McCaffrey",
                     team="SF",
                     position="RB",
@@ -51,9 +84,9 @@ class TestTeamRoster:
                     notes="Workhorse RB",
                 ),
             ),
-            DraftPick(
+            DraftPick.model_construct(
                 owner="Willow",
-                player=Player(
+                player=Player.model_construct(
                     name="Tyreek Hill",
                     team="MIA",
                     position="WR",
@@ -64,9 +97,9 @@ class TestTeamRoster:
                     notes="Speedy WR",
                 ),
             ),
-            DraftPick(
+            DraftPick.model_construct(
                 owner="Xander",
-                player=Player(
+                player=Player.model_construct(
                     name="Lamar Jackson",
                     team="BAL",
                     position="QB",
@@ -79,137 +112,94 @@ class TestTeamRoster:
             ),
         ]
 
-        return DraftState(teams=teams, picks=picks)
-
-    @pytest.mark.asyncio
-    async def test_get_team_roster_success(self, mock_draft_state):
-        """Test successful retrieval of team roster with enrichment."""
-
-        # Mock rankings data for enrichment
-        mock_qb_rankings = {
-            "success": True,
-            "players": [
-                {
-                    "name": "Josh Allen",
-                    "team": "BUF",
-                    "position": "QB",
-                    "bye_week": 12,
-                    "ranking": 1,
-                    "projected_points": 99.0,
-                    "notes": "Elite QB",
-                }
-            ],
-        }
-
-        mock_rb_rankings = {
-            "success": True,
-            "players": [
-                {
-                    "name": "Christian McCaffrey",
-                    "team": "SF",
-                    "position": "RB",
-                    "bye_week": 9,
-                    "ranking": 2,
-                    "projected_points": 98.0,
-                    "notes": "Workhorse RB",
-                }
-            ],
-        }
-
-        with patch("src.tools.team_roster.get_cached_draft_state") as mock_draft:
-            with patch("src.tools.team_roster.get_player_rankings") as mock_rankings:
-                mock_draft.return_value = mock_draft_state
-
-                # Return different rankings based on position
-                def rankings_side_effect(position):
-                    if position == "QB":
-                        return mock_qb_rankings
-                    elif position == "RB":
-                        return mock_rb_rankings
-                    return {"success": True, "players": []}
-
-                mock_rankings.side_effect = rankings_side_effect
-
-                result = await get_team_roster("Buffy")
-
-                assert result["success"] is True
-                assert result["owner_name"] == "Buffy"
-                assert len(result["players"]) == 2
-
-                # Check that Buffy's players are returned with enriched data
-                players_by_name = {p.name: p for p in result["players"]}
-
-                josh = players_by_name["Josh Allen"]
-                assert josh.bye_week == 12  # Should be enriched, not default 1
-                assert josh.projected_points == 99.0
-                assert josh.ranking == 1
-
-                cmc = players_by_name["Christian McCaffrey"]
-                assert cmc.bye_week == 9  # Should be enriched, not default 1
-                assert cmc.projected_points == 98.0
-                assert cmc.ranking == 2
-
-                # Verify players are Player objects
-                for player in result["players"]:
-                    assert isinstance(player, Player)
-
-                # Verify draft state and rankings were fetched
-                mock_draft.assert_called_once()
-                assert (
-                    mock_rankings.call_count == 4
-                )  # 2 positions * 2 calls each (check + fetch)
-
-    @pytest.mark.asyncio
-    async def test_get_team_roster_case_insensitive(self, mock_draft_state):
-        """Test that owner name matching is case insensitive."""
-
-        with patch("src.tools.team_roster.get_cached_draft_state") as mock_draft:
-            mock_draft.return_value = mock_draft_state
-
-            result = await get_team_roster("buffy")
-
-            assert result["success"] is True
-            assert result["owner_name"] == "buffy"
-            assert len(result["players"]) == 2
-
-            # Check that Buffy's players are returned despite case difference
-            player_names = [p.name for p in result["players"]]
-            assert "Josh Allen" in player_names
-            assert "Christian McCaffrey" in player_names
-
-    @pytest.mark.asyncio
-    async def test_get_team_roster_no_picks(self, mock_draft_state):
-        """Test owner with no picks returns empty list."""
+        return DraftState.model_construct(teams=teams, picks=picks)
 
-        with patch("src.tools.team_roster.get_cached_draft_state") as mock_draft:
-            mock_draft.return_value = mock_draft_state
+    @pytest.fixture(autouse=True)
+    def draft_state_stub(self, monkeypatch, mock_draft_state):
+        """Replace the draft state lookup with an async stub of the mock state."""
+        stub = AsyncStub(mock_draft_state)
+        monkeypatch.setattr("src.tools.team_roster.get_cached_draft_state", stub)
+        return stub
 
-            result = await get_team_roster("Giles")
+    @pytest.fixture(autouse=True)
+    def rankings_stub(self, monkeypatch):
+        """Replace the rankings lookup so enrichment never hits the network."""
+        stub = AsyncStub(EMPTY_RANKINGS)
+        monkeypatch.setattr("src.tools.team_roster.get_player_rankings", stub)
+        return stub
 
-            assert result["success"] is True
-            assert result["owner_name"] == "Giles"
-            assert len(result["players"]) == 0
-            assert result["players"] == []
-
-    @pytest.mark.asyncio
-    async def test_get_team_roster_single_pick(self, mock_draft_state):
-        """Test owner with single pick."""
-
-        with patch("src.tools.team_roster.get_cached_draft_state") as mock_draft:
-            mock_draft.return_value = mock_draft_state
+    async def test_get_team_roster_success(self, draft_state_stub, rankings_stub):
+        """Test successful retrieval of team roster with enrichment."""
 
-            result = await get_team_roster("Willow")
+        # Return different rankings based on position
+        rankings_stub.side_effect = lambda position: RANKINGS_BY_POSITION.get(
+            position, EMPTY_RANKINGS
+        )
+
+        result = await get_team_roster("Buffy")
+
+        assert result["success"] is True
+        assert result["owner_name"] == "Buffy"
+        assert len(result["players"]) == 2
+
+        # Check that Buffy's players are returned with enriched data
+        players_by_name = {p.name: p for p in result["players"]}
+
+        josh = players_by_name["Josh Allen"]
+        assert josh.bye_week == 12  # Should be enriched, not default 1
+        assert josh.projected_points == 99.0
+        assert josh.ranking == 1
+
+        cmc = players_by_name["Christian McCaffrey"]
+        assert cmc.bye_week == 9  # Should be enriched, not default 1
+        assert cmc.projected_points == 98.0
+        assert cmc.ranking == 2
+
+        # Verify players are Player objects
+        non_players = [p for p in result["players"] if not isinstance(p, Player)]
+        assert not non_players, f"Non-Player roster entries: {non_players}"
+
+        # Verify draft state and rankings were fetched
+        assert draft_state_stub.calls == [((), {})]
+        # 2 positions * 2 calls each (check + fetch)
+        assert len(rankings_stub.calls) == 4
+
+    @pytest.mark.parametrize(
+        "owner_name,expected_owner,expected_players",
+        [
+            pytest.param(
+                "buffy",
+                "buffy",
+                {("Josh Allen", "QB"), ("Christian McCaffrey", "RB")},
+                id="case_insensitive",
+            ),
+            pytest.param(
+                "  Buffy  ",
+                "Buffy",
+                {("Josh Allen", "QB"), ("Christian McCaffrey", "RB")},
+                id="owner_name_trimming",
+            ),
+            pytest.param("Willow", "Willow", {("Tyreek Hill", "WR")}, id="single_pick"),
+            pytest.param(
+                "Xander", "Xander", {("Lamar Jackson", "QB")}, id="other_owner"
+            ),
+            pytest.param("Giles", "Giles", set(), id="no_picks"),
+        ],
+    )
+    async def test_get_team_roster_lookup(
+        self, owner_name, expected_owner, expected_players
+    ):
+        """Test each owner gets exactly their own picks."""
 
-            assert result["success"] is True
-            assert result["owner_name"] == "Willow"
-            assert len(result["players"]) == 1
+        result = await get_team_roster(owner_name)
 
-            player = result["players"][0]
-            assert player.name == "Tyreek Hill"
-            assert player.position == "WR"
-            assert isinstance(player, Player)
+        assert result["success"] is True
+        assert result["owner_name"] == expected_owner
+        assert {(p.name, p.position) for p in result["players"]} == expected_players
+        assert len(result["players"]) == len(expected_players)
+        non_players = [p for p in result["players"] if not isinstance(p, Player)]
+        assert not non_players, f"Non-Player roster entries: {non_players}"
 
-    @pytest.mark.asyncio
     async def test_get_team_roster_empty_owner_name(self):
         """Test error handling for empty owner name."""
 
@@ -219,7 +209,6 @@ class TestTeamRoster:
         assert result["error_type"] == "invalid_owner_name"
         assert "cannot be empty" in result["error"]
 
-    @pytest.mark.asyncio
     async def test_get_team_roster_whitespace_owner_name(self):
         """Test error handling for whitespace-only owner name."""
 
@@ -229,124 +218,64 @@ class TestTeamRoster:
         assert result["error_type"] == "invalid_owner_name"
         assert "cannot be empty" in result["error"]
 
-    @pytest.mark.asyncio
-    async def test_get_team_roster_draft_state_fail(self):
+    async def test_get_team_roster_draft_state_fail(self, draft_state_stub):
         """Test handling when draft state fetch fails."""
 
-        with patch("src.tools.team_roster.get_cached_draft_state") as mock_draft:
-            mock_draft.return_value = {"success": False, "error": "Sheet access denied"}
+        draft_state_stub.return_value = {
+            "success": False,
+            "error": "Sheet access denied",
+        }
 
-            result = await get_team_roster("Buffy")
+        result = await get_team_roster("Buffy")
 
-            assert result["success"] is False
-            assert result["error_type"] == "draft_state_failed"
-            assert "Sheet access denied" in result["error"]
+        assert result["success"] is False
+        assert result["error_type"] == "draft_state_failed"
+        assert "Sheet access denied" in result["error"]
 
-    @pytest.mark.asyncio
-    async def test_get_team_roster_unexpected_draft_state_format(self):
+    async def test_get_team_roster_unexpected_draft_state_format(
+        self, draft_state_stub
+    ):
         """Test handling when draft state has unexpected format."""
 
-        with patch("src.tools.team_roster.get_cached_draft_state") as mock_draft:
-            # Return something that's not a DraftState object or error dict
-            mock_draft.return_value = "invalid_format"
+        # Return something that's not a DraftState object or error dict
+        draft_state_stub.return_value = "invalid_format"
 
-            result = await get_team_roster("Buffy")
+        result = await get_team_roster("Buffy")
 
-            assert result["success"] is False
-            assert result["error_type"] == "invalid_draft_state"
-            assert "Unexpected draft state format" in result["error"]
+        assert result["success"] is False
+        assert result["error_type"] == "invalid_draft_state"
+        assert "Unexpected draft state format" in result["error"]
 
-    @pytest.mark.asyncio
-    async def test_get_team_roster_unexpected_error(self, mock_draft_state):
+    async def test_get_team_roster_unexpected_error(self, draft_state_stub):
         """Test handling of unexpected errors."""
 
-        with patch("src.tools.team_roster.get_cached_draft_state") as mock_draft:
-            mock_draft.side_effect = Exception("Network connection failed")
-
-            result = await get_team_roster("Buffy")
-
-            assert result["success"] is False
-            assert result["error_type"] == "unexpected_error"
-            assert "Network connection failed" in result["error"]
-            assert "troubleshooting" in result
+        draft_state_stub.side_effect = Exception("Network connection failed")
 
-    @pytest.mark.asyncio
-    async def test_get_team_roster_owner_name_trimming(self, mock_draft_state):
-        """Test that owner names are trimmed of whitespace."""
+        result = await get_team_roster("Buffy")
 
-        with patch("src.tools.team_roster.get_cached_draft_state") as mock_draft:
-            mock_draft.return_value = mock_draft_state
-
-            result = await get_team_roster("  Buffy  ")
-
-            assert result["success"] is True
-            assert result["owner_name"] == "Buffy"  # Should be trimmed
-            assert len(result["players"]) == 2
-
-    @pytest.mark.asyncio
-    async def test_get_team_roster_multiple_owners_verification(self, mock_draft_state):
-        """Test that each owner gets only their own picks."""
-
-        with patch("src.tools.team_roster.get_cached_draft_state") as mock_draft:
-            mock_draft.return_value = mock_draft_state
-
-            # Test Buffy (2 picks)
-            result_buffy = await get_team_roster("Buffy")
-            assert len(result_buffy["players"]) == 2
-            buffy_names = [p.name for p in result_buffy["players"]]
-            assert "Josh Allen" in buffy_names
-            assert "Christian McCaffrey" in buffy_names
-
-            # Test Willow (1 pick)
-            result_willow = await get_team_roster("Willow")
-            assert len(result_willow["players"]) == 1
-            willow_names = [p.name for p in result_willow["players"]]
-            assert "Tyreek Hill" in willow_names
-
-            # Test Xander (1 pick)
-            result_xander = await get_team_roster("Xander")
-            assert len(result_xander["players"]) == 1
-            xander_names = [p.name for p in result_xander["players"]]
-            assert "Lamar Jackson" in xander_names
-
-            # Verify no cross-contamination
-            assert "Tyreek Hill" not in buffy_names
-            assert "Lamar Jackson" not in buffy_names
-            assert "Josh Allen" not in willow_names
-            assert "Christian McCaffrey" not in willow_names
+        assert result["success"] is False
+        assert result["error_type"] == "unexpected_error"
+        assert "Network connection failed" in result["error"]
+        assert "troubleshooting" in result
 
-    @pytest.mark.asyncio
-    async def test_get_team_roster_player_not_found_in_rankings(
-        self, mock_draft_state, caplog
-    ):
+    async def test_get_team_roster_player_not_found_in_rankings(self, caplog):
         """Test error logging when drafted player not found in rankings."""
 
-        # Mock rankings that don't contain the drafted players
-        mock_empty_rankings = {
-            "success": True,
-            "players": [],  # Empty - players won't be found
-        }
+        result = await get_team_roster("Buffy")
+
+        assert result["success"] is True
+        assert len(result["players"]) == 2
 
-        with patch("src.tools.team_roster.get_cached_draft_state") as mock_draft:
-            with patch("src.tools.team_roster.get_player_rankings") as mock_rankings:
-                mock_draft.return_value = mock_draft_state
-                mock_rankings.return_value = mock_empty_rankings
-
-                with caplog.at_level(logging.ERROR):
-                    result = await get_team_roster("Buffy")
-
-                assert result["success"] is True
-                assert len(result["players"]) == 2
-
-                # Check that error was logged for missing players
-                error_logs = [
-                    record for record in caplog.records if record.levelname == "ERROR"
-                ]
-                assert len(error_logs) == 2  # One for each player not found
-
-                assert "PLAYER DATA ISSUE" in error_logs[0].message
-                assert (
-                    "Josh Allen" in error_logs[0].message
-                    or "Christian McCaffrey" in error_logs[0].message
-                )
-                assert "was not found in" in error_logs[0].message
+        # Check that error was logged for missing players; ERROR records pass
+        # the default WARNING threshold, so caplog sees them
+        error_logs = [
+            record for record in caplog.records if record.levelname == "ERROR"
+        ]
+        assert len(error_logs) == 2  # One for each player not found
+
+        assert "PLAYER DATA ISSUE" in error_logs[0].message
+        assert (
+            "Josh Allen" in error_logs[0].message
+            or "Christian McCaffrey" in error_logs[0].message
+        )
+        assert "was not found in" in error_logs[0].message